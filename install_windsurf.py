@@ -16,6 +16,10 @@ automatic updates via systemd.
 
 from __future__ import annotations
 
+import contextlib
+import fcntl
+import getpass
+import hashlib
 import inspect
 import json
 import os
@@ -23,15 +27,13 @@ import shutil
 import subprocess
 import sys
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Annotated
 from typing import Any
 
-import httpx
 import typer
 from rich.console import Console
-from rich.progress import Progress
-from rich.progress import SpinnerColumn
-from rich.progress import TextColumn
 
 console = Console()
 app = typer.Typer(help="Install and manage Windsurf editor")
@@ -41,7 +43,9 @@ INSTALL_DIR = HOME_DIR / ".local/share/windsurf"
 BIN_DIR = HOME_DIR / ".local/bin"
 DESKTOP_DIR = HOME_DIR / ".local/share/applications"
 SYSTEMD_DIR = HOME_DIR / ".config/systemd/user"
+DEFAULT_STORE_DIR = Path("/opt/windsurf")
 API_URL = "https://windsurf-stable.codeium.com/api/update/linux-x64/stable/latest"
+SCRIPT_URL = "https://scripts.joshthomas.dev/install_windsurf.py"
 
 
 def create_update_script() -> str:
@@ -75,11 +79,7 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
-import httpx
 from rich.console import Console
-from rich.progress import Progress
-from rich.progress import SpinnerColumn
-from rich.progress import TextColumn
 
 console = Console()
 
@@ -87,6 +87,7 @@ console = Console()
 HOME_DIR = Path.home()
 INSTALL_DIR = HOME_DIR / ".local/share/windsurf"
 API_URL = "https://windsurf-stable.codeium.com/api/update/linux-x64/stable/latest"
+SCRIPT_URL = "{SCRIPT_URL}"
 
 
 def get_current_version() -> str:
@@ -111,6 +112,10 @@ def get_current_version() -> str:
 
 def update_windsurf() -> None:
     """Update Windsurf to the latest version."""
+    # Shared installs link into a store, which only the install script manages
+    if INSTALL_DIR.is_symlink():
+        os.execvp("uv", ["uv", "run", "--quiet", SCRIPT_URL, "update"])
+
     console.print("[bold]Windsurf Update[/bold]")
 
     # Check if Windsurf is installed
@@ -233,8 +238,8 @@ WantedBy=timers.target
         console.print("You can manually update using the update-windsurf script.")
 
 
-def create_desktop_entry() -> None:
-    """Create the desktop entry for Windsurf."""
+def create_desktop_entry(install_dir: Path = INSTALL_DIR) -> None:
+    """Create the desktop entry for Windsurf installed in install_dir."""
     DESKTOP_DIR.mkdir(parents=True, exist_ok=True)
 
     desktop_path = DESKTOP_DIR / "windsurf.desktop"
@@ -244,7 +249,7 @@ Name=Windsurf
 Comment=Windsurf Code Editor
 GenericName=Text Editor
 Exec=windsurf %F
-Icon={INSTALL_DIR}/resources/app/resources/linux/code.png
+Icon={install_dir}/resources/app/resources/linux/code.png
 Type=Application
 StartupNotify=true
 StartupWMClass=windsurf
@@ -256,14 +261,14 @@ Keywords=windsurf;editor;code;development;
     console.print("[green]Desktop entry created.[/green]")
 
 
-def create_launcher() -> None:
-    """Create the launcher script for Windsurf."""
+def create_launcher(install_dir: Path = INSTALL_DIR) -> None:
+    """Create the launcher script for Windsurf installed in install_dir."""
     BIN_DIR.mkdir(parents=True, exist_ok=True)
 
     launcher_path = BIN_DIR / "windsurf"
     with launcher_path.open("w") as f:
         f.write(f"""#!/bin/bash
-exec {INSTALL_DIR}/windsurf "$@"
+exec {install_dir}/windsurf "$@"
 """)
 
     # Make the launcher executable
@@ -289,6 +294,9 @@ def get_current_version() -> str | None:
 
 def get_latest_version_info() -> dict[str, Any]:
     """Get information about the latest version from the API."""
+    # httpx is slow to import, so only load it for the commands that need it
+    import httpx
+
     try:
         with httpx.Client() as client:
             response = client.get(API_URL)
@@ -301,6 +309,11 @@ def get_latest_version_info() -> dict[str, Any]:
 
 def download_file(url: str, target_path: Path) -> None:
     """Download a file with progress bar."""
+    import httpx
+    from rich.progress import Progress
+    from rich.progress import SpinnerColumn
+    from rich.progress import TextColumn
+
     try:
         with Progress(
             SpinnerColumn(),
@@ -321,41 +334,62 @@ def download_file(url: str, target_path: Path) -> None:
         sys.exit(1)
 
 
-def _perform_install_or_update(version_info: dict[str, Any]) -> None:
-    """Download, extract, and install Windsurf from version info."""
+def _get_download_url(version_info: dict[str, Any]) -> str:
+    """Get the download URL from version info, exiting if there is none."""
     download_url = version_info.get("url")
     if not download_url:
         console.print("[red]Error: Could not get download URL from version info.[/red]")
         sys.exit(1)
+    return download_url
+
+
+def _extract_archive(archive_path: Path, temp_path: Path) -> Path:
+    """Extract a Windsurf archive and return the directory holding its contents."""
+    extract_path = temp_path / "windsurf-extract"
+    extract_path.mkdir()
+
+    console.print("Extracting...")
+    subprocess.run(
+        ["tar", "-xzf", str(archive_path), "-C", str(extract_path)], check=True
+    )
+
+    # Check for top-level directory and adjust the extract_path if needed
+    top_level_dirs = [item for item in extract_path.iterdir() if item.is_dir()]
+    if len(top_level_dirs) == 1 and top_level_dirs[0].name == "Windsurf":
+        # If the archive has a top-level "Windsurf" directory, use that as our source
+        extract_path = top_level_dirs[0]
+
+    return extract_path
+
+
+def _remove_install_dir() -> None:
+    """Remove the installation directory, or the link to the shared store."""
+    if INSTALL_DIR.is_symlink():
+        INSTALL_DIR.unlink()
+    elif INSTALL_DIR.exists():
+        shutil.rmtree(str(INSTALL_DIR))
+
+
+def _perform_install_or_update(version_info: dict[str, Any]) -> None:
+    """Download, extract, and install Windsurf from version info."""
+    download_url = _get_download_url(version_info)
 
     # Create temporary directory
     with tempfile.TemporaryDirectory() as temp_dir:
         temp_path = Path(temp_dir)
         archive_path = temp_path / "windsurf-latest.tar.gz"
-        extract_path = temp_path / "windsurf-extract"
-        extract_path.mkdir()
 
         # Download the latest version
         download_file(download_url, archive_path)
 
         # Extract the archive
-        console.print("Extracting...")
-        subprocess.run(
-            ["tar", "-xzf", str(archive_path), "-C", str(extract_path)], check=True
-        )
-
-        # Check for top-level directory and adjust the extract_path if needed
-        top_level_dirs = [item for item in extract_path.iterdir() if item.is_dir()]
-        if len(top_level_dirs) == 1 and top_level_dirs[0].name == "Windsurf":
-            # If the archive has a top-level "Windsurf" directory, use that as our source
-            extract_path = top_level_dirs[0]
+        extract_path = _extract_archive(archive_path, temp_path)
 
         # Install new version
         console.print("Installing...")
 
         # Clear the installation directory if it exists
-        if INSTALL_DIR.exists():
-            shutil.rmtree(str(INSTALL_DIR))
+        _remove_install_dir()
 
         # Create the installation directory
         INSTALL_DIR.mkdir(parents=True, exist_ok=True)
@@ -368,6 +402,236 @@ def _perform_install_or_update(version_info: dict[str, Any]) -> None:
                 shutil.copy2(str(item), str(INSTALL_DIR / item.name))
 
 
+def _file_sha256(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _get_store_dir(install_dir: Path = INSTALL_DIR) -> Path | None:
+    """Get the shared store an installation links into, or None for a private install."""
+    if not install_dir.is_symlink():
+        return None
+    version_dir = Path(os.readlink(install_dir))
+    if version_dir.parent.name != "versions":
+        return None
+    return version_dir.parent.parent
+
+
+def _make_shared_dir(path: Path, sticky: bool = False) -> None:
+    """
+    Create a store directory that every user sharing the store can write to.
+
+    With `sticky` set, entries can only be renamed or removed by their owner.
+    """
+    path.mkdir(parents=True, exist_ok=True)
+    with contextlib.suppress(PermissionError):
+        # Group-writable and setgid, so the store's group carries over to new files
+        path.chmod(0o3775 if sticky else 0o2775)
+
+
+def _store_problem(store_dir: Path) -> str | None:
+    """Describe why this user can't use the shared store, or None if they can."""
+    if not store_dir.is_dir():
+        return f"No shared store found at {store_dir}."
+    for name in ("versions", "refs", "tmp", ".lock"):
+        path = store_dir / name
+        # Missing entries are created in the store directory itself
+        target = path if path.exists() else store_dir
+        if not os.access(target, os.W_OK):
+            return f"You don't have write access to {target}."
+    return None
+
+
+def _check_store(store_dir: Path) -> None:
+    """Exit with setup instructions unless this user can use the shared store."""
+    problem = _store_problem(store_dir)
+    if problem is None:
+        return
+    console.print(f"[red]Error: {problem}[/red]")
+    console.print(
+        "The shared store has to be created by an administrator, writable by a "
+        "group you belong to, for example:"
+    )
+    console.print(f"  sudo install -d -m 2775 -g <group> {store_dir}")
+    sys.exit(1)
+
+
+@contextlib.contextmanager
+def _lock_store(store_dir: Path) -> Iterator[None]:
+    """Hold the store's lock, so installs and garbage collection don't interleave."""
+    # Sticky, so users can only remove their own versions and references
+    _make_shared_dir(store_dir / "versions", sticky=True)
+    _make_shared_dir(store_dir / "refs", sticky=True)
+    _make_shared_dir(store_dir / "tmp")
+    lock_path = store_dir / ".lock"
+    with lock_path.open("a") as lock_file:
+        with contextlib.suppress(PermissionError):
+            lock_path.chmod(0o664)
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _make_read_only(version_dir: Path) -> None:
+    """Strip write permission from a store version, so no user can change it."""
+    for root, dirs, files in os.walk(version_dir):
+        for name in dirs + files:
+            path = Path(root) / name
+            if path.is_symlink():
+                continue
+            executable = path.is_dir() or path.stat().st_mode & 0o100
+            path.chmod(0o555 if executable else 0o444)
+    version_dir.chmod(0o555)
+
+
+def _make_writable(path: Path) -> None:
+    """Give the owner write permission on a directory tree again, so it can be removed."""
+    path.chmod(0o755)
+    for root, dirs, _ in os.walk(path):
+        for name in dirs:
+            dir_path = Path(root) / name
+            if not dir_path.is_symlink():
+                dir_path.chmod(0o755)
+
+
+def _install_into_store(version_info: dict[str, Any], store_dir: Path) -> Path:
+    """
+    Add a Windsurf version to the shared store and link this user's install to it.
+
+    Versions are keyed by the SHA-256 of their archive. When the API already
+    reports the hash of a version that is in the store, nothing is downloaded.
+    The version this user linked to before is released afterwards.
+    """
+    download_url = _get_download_url(version_info)
+    expected_hash = version_info.get("sha256hash")
+    old_store_dir = _get_store_dir()
+    old_version_dir = Path(os.readlink(INSTALL_DIR)) if old_store_dir else None
+
+    with _lock_store(store_dir):
+        if expected_hash and (store_dir / "versions" / expected_hash).exists():
+            console.print("Version already in the shared store, skipping download.")
+            content_hash = expected_hash
+        else:
+            with tempfile.TemporaryDirectory(dir=store_dir / "tmp") as temp_dir:
+                temp_path = Path(temp_dir)
+                archive_path = temp_path / "windsurf-latest.tar.gz"
+
+                download_file(download_url, archive_path)
+                content_hash = _file_sha256(archive_path)
+                if expected_hash and content_hash != expected_hash:
+                    console.print(
+                        "[red]Error: Downloaded archive does not match the expected hash.[/red]"
+                    )
+                    sys.exit(1)
+
+                new_version_dir = store_dir / "versions" / content_hash
+                if not new_version_dir.exists():
+                    extract_path = _extract_archive(archive_path, temp_path)
+                    console.print("Adding to the shared store...")
+                    # Moving a directory needs write permission on it, so only
+                    # make the version read-only once it's in place
+                    extract_path.rename(new_version_dir)
+                    _make_read_only(new_version_dir)
+
+        # Reference the version and link to it before releasing the lock, so
+        # GC never sees a reference that the installation doesn't match yet
+        version_dir = store_dir / "versions" / content_hash
+        refs_dir = store_dir / "refs" / content_hash
+        _make_shared_dir(refs_dir, sticky=True)
+        (refs_dir / getpass.getuser()).write_text(f"{INSTALL_DIR}\n")
+        _link_install_dir(version_dir)
+
+    if old_store_dir and old_version_dir and old_version_dir != version_dir:
+        _release_store_version(old_store_dir, old_version_dir.name)
+    return version_dir
+
+
+def _link_install_dir(version_dir: Path) -> None:
+    """Point the installation directory at a version in the shared store."""
+    if not INSTALL_DIR.is_symlink():
+        _remove_install_dir()
+    INSTALL_DIR.parent.mkdir(parents=True, exist_ok=True)
+    temp_link = INSTALL_DIR.with_name(f"{INSTALL_DIR.name}.{os.getpid()}")
+    temp_link.symlink_to(version_dir, target_is_directory=True)
+    temp_link.replace(INSTALL_DIR)
+
+
+def _release_store_version(store_dir: Path, content_hash: str) -> None:
+    """Drop this user's reference to a store version and collect garbage."""
+    ref_path = store_dir / "refs" / content_hash / getpass.getuser()
+    with contextlib.suppress(FileNotFoundError):
+        ref_path.unlink()
+    _collect_garbage(store_dir)
+
+
+def _is_live_ref(ref_path: Path, version_dir: Path) -> bool:
+    """Check whether a user's reference to a store version is still in use."""
+    try:
+        link_path = Path(ref_path.read_text().strip())
+        # Raises if the link is gone or no longer a link
+        os.readlink(link_path)
+        return link_path.resolve(strict=True) == version_dir.resolve()
+    except PermissionError:
+        # Can't see into the user's home, so trust the reference
+        return True
+    except OSError:
+        # The link is gone or no longer a link
+        return False
+
+
+def _collect_garbage(store_dir: Path) -> list[str]:
+    """
+    Remove store versions that no user references, returning their hashes.
+
+    References whose installation no longer links to the version they name,
+    for example because the user's home was removed, are dropped first.
+    Versions are read-only and can only be removed by the user who added
+    them, or root. Leftovers of interrupted installs in the store's tmp
+    directory are removed too.
+    """
+    removed = []
+    with _lock_store(store_dir):
+        # Installs only use tmp while holding the lock, so anything in it now
+        # was left behind by one that was interrupted
+        for temp_dir in (store_dir / "tmp").iterdir():
+            with contextlib.suppress(OSError):
+                _make_writable(temp_dir)
+                shutil.rmtree(str(temp_dir))
+
+        for version_dir in sorted((store_dir / "versions").iterdir()):
+            refs_dir = store_dir / "refs" / version_dir.name
+            ref_paths = list(refs_dir.iterdir()) if refs_dir.exists() else []
+            live_refs = 0
+            for ref_path in ref_paths:
+                if _is_live_ref(ref_path, version_dir):
+                    live_refs += 1
+                else:
+                    with contextlib.suppress(OSError):
+                        ref_path.unlink()
+            if live_refs:
+                continue
+
+            try:
+                _make_writable(version_dir)
+            except PermissionError:
+                console.print(
+                    f"[yellow]Warning: Unreferenced version {version_dir.name[:12]} "
+                    "can only be removed by the user who added it, or root.[/yellow]"
+                )
+                continue
+            shutil.rmtree(str(version_dir))
+            with contextlib.suppress(OSError):
+                refs_dir.rmdir()
+            removed.append(version_dir.name)
+    return removed
+
+
 @app.command()
 def install(
     skip_systemd: bool = typer.Option(
@@ -376,8 +640,29 @@ def install(
     force: bool = typer.Option(
         False, "--force", help="Force installation even if already installed"
     ),
+    shared: bool = typer.Option(
+        False,
+        "--shared",
+        help="Install into a store shared by all users instead of the home directory",
+    ),
+    store_dir: Annotated[
+        Path,
+        typer.Option(
+            "--store-dir",
+            envvar="WINDSURF_STORE_DIR",
+            help="Location of the shared store",
+        ),
+    ] = DEFAULT_STORE_DIR,
 ) -> None:
-    """Install Windsurf editor and set up automatic updates."""
+    """
+    Install Windsurf editor and set up automatic updates.
+
+    With --shared, each version is installed once, read-only, into a store
+    shared by every user on the machine, keyed by the hash of its archive,
+    and only this user's launcher and desktop entry point into it. The store
+    directory should be writable by a group all of its users belong to.
+    Versions no user references any more are removed automatically.
+    """
     console.print("[bold]Windsurf Installation[/bold]")
 
     # Check if Windsurf is already installed
@@ -386,6 +671,11 @@ def install(
         console.print("Use --force to reinstall.")
         return
 
+    # References are compared to resolved paths, so use one too
+    store_dir = store_dir.resolve()
+    if shared:
+        _check_store(store_dir)
+
     # Get latest version information
     console.print("Getting download information...")
     version_info = get_latest_version_info()
@@ -394,14 +684,27 @@ def install(
 
     console.print(f"Installing Windsurf version: [green]{version}[/green]")
 
-    # Perform the actual installation using the common function
-    _perform_install_or_update(version_info)
+    old_store_dir = _get_store_dir()
+    if shared:
+        install_dir = _install_into_store(version_info, store_dir)
+    else:
+        # Perform the actual installation using the common function
+        _perform_install_or_update(version_info)
+        install_dir = INSTALL_DIR
+        if old_store_dir:
+            # This user no longer needs the shared version
+            if problem := _store_problem(old_store_dir):
+                console.print(
+                    f"[yellow]Warning: Could not release the shared version: {problem}[/yellow]"
+                )
+            else:
+                _collect_garbage(old_store_dir)
 
     # Create launcher script
-    create_launcher()
+    create_launcher(install_dir)
 
     # Create desktop entry
-    create_desktop_entry()
+    create_desktop_entry(install_dir)
 
     # Set up systemd service
     if not skip_systemd:
@@ -483,9 +786,17 @@ def update() -> None:
         console.print("[green]Already running the latest version![/green]")
         return
 
-    # Perform the update using the common function
     console.print("Updating Windsurf...")
-    _perform_install_or_update(version_info)
+    store_dir = _get_store_dir()
+    if store_dir:
+        _check_store(store_dir)
+        version_dir = _install_into_store(version_info, store_dir)
+        # The launcher and desktop entry point at the version in the store
+        create_launcher(version_dir)
+        create_desktop_entry(version_dir)
+    else:
+        # Perform the update using the common function
+        _perform_install_or_update(version_info)
 
     console.print(f"[bold green]✅ Update complete![/bold green]")
     console.print(f"Windsurf updated from {current_version} to {remote_version}")
@@ -537,8 +848,20 @@ def uninstall(
         console.print("[green]Desktop entry removed.[/green]")
 
     # Remove installation
-    if INSTALL_DIR.exists():
-        shutil.rmtree(str(INSTALL_DIR))
+    store_dir = _get_store_dir()
+    if store_dir:
+        version_dir = Path(os.readlink(INSTALL_DIR))
+        INSTALL_DIR.unlink()
+        console.print("[green]Link to the shared Windsurf store removed.[/green]")
+        if problem := _store_problem(store_dir):
+            # The dangling reference is dropped by the next gc
+            console.print(
+                f"[yellow]Warning: Could not release the shared version: {problem}[/yellow]"
+            )
+        else:
+            _release_store_version(store_dir, version_dir.name)
+    elif INSTALL_DIR.exists() or INSTALL_DIR.is_symlink():
+        _remove_install_dir()
         console.print("[green]Windsurf installation removed.[/green]")
 
     # Remove configuration
@@ -557,5 +880,33 @@ def uninstall(
     console.print("[bold green]✅ Uninstallation complete![/bold green]")
 
 
+@app.command()
+def gc(
+    store_dir: Annotated[
+        Path,
+        typer.Option(
+            "--store-dir",
+            envvar="WINDSURF_STORE_DIR",
+            help="Location of the shared store",
+        ),
+    ] = DEFAULT_STORE_DIR,
+) -> None:
+    """Remove versions from the shared store that no user references."""
+    # References are compared to resolved paths, so use one too
+    store_dir = store_dir.resolve()
+    _check_store(store_dir)
+    if not (store_dir / "versions").exists():
+        console.print(f"[red]Error: No shared store found at {store_dir}.[/red]")
+        sys.exit(1)
+
+    removed = _collect_garbage(store_dir)
+    for content_hash in removed:
+        console.print(
+            f"[green]Removed unreferenced version {content_hash[:12]}.[/green]"
+        )
+    remaining = sum(1 for _ in (store_dir / "versions").iterdir())
+    console.print(f"Removed {len(removed)} version(s), {remaining} left in the store.")
+
+
 if __name__ == "__main__":
     app()
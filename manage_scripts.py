@@ -8,39 +8,448 @@
 # ///
 from __future__ import annotations
 
+import email.utils
+import functools
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+import tomllib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated
+from typing import Any
+from typing import NamedTuple
 
 import typer
 from rich.console import Console
 from rich.prompt import Prompt
+from rich.table import Table
 
-AVAILABLE_SCRIPTS = [
-    "git-bare-clone",
-    "install-windsurf",
-    "manage-scripts",
-]
 BIN_DIR = Path.home() / ".local" / "bin"
+CACHE_DIR = Path(
+    os.environ.get("SCRIPTS_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "scripts"
+)
+# The cache only holds what can be fetched again, since it may be wiped any
+# time. Frozen environments and the record of installed scripts, which frozen
+# wrappers and upgrades depend on, are kept in the data directory instead
+DATA_DIR = (
+    Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    / "scripts"
+)
+DEFAULT_CACHE_TTL = 60 * 60  # seconds between background revalidations
+ENVIRONMENTS_DIR = DATA_DIR / "environments"
+FETCH_ESTIMATE_STAGE = "fetch (estimated)"
+SHELL_ESTIMATE_STAGE = "shell startup (estimated)"
+MANIFEST_FILENAME = "manifest.json"
 SCRIPTS_DOMAIN = "scripts.joshthomas.dev"
+SCRIPTS_URL = os.environ.get("SCRIPTS_BASE_URL") or f"https://{SCRIPTS_DOMAIN}"
+STATE_PATH = DATA_DIR / "installed.json"
 
 app = typer.Typer(help=f"Manage scripts from {SCRIPTS_DOMAIN}")
 console = Console()
 
 
-def _install_single_script(script_name: str) -> bool:
-    """Installs a single script and returns True on success, False on failure."""
-    console.print(f"\nAttempting to install '{script_name}'...", style="yellow")
+class PreparedScript(NamedTuple):
+    """The result of fetching a script and building its environment."""
+
+    source: str
+    environment: str
+    environment_key: str
+    environment_dir: Path | None
+    elapsed: float
+
+
+def _fetch_script(filename: str) -> tuple[Path, str]:
+    """
+    Fetch a file into the local cache and return the cached path and its source.
+
+    An existing copy is revalidated with If-None-Match/If-Modified-Since, so an
+    unchanged file costs a single 304 round-trip. If the server cannot be
+    reached the cached copy is used as-is; the error is only raised when there
+    is nothing cached to fall back on. The source is one of "fetched",
+    "not modified" or "offline".
+    """
+    # urllib.request pulls in http.client and ssl, so only load it to fetch
+    import urllib.error
+    import urllib.request
+
+    cache_path = CACHE_DIR / filename
+    etag_path = CACHE_DIR / f"{filename}.etag"
+    checked_path = CACHE_DIR / f"{filename}.checked"
+
+    request = urllib.request.Request(f"{SCRIPTS_URL}/{filename}")
+    if cache_path.exists():
+        if etag_path.exists() and (etag := etag_path.read_text().strip()):
+            request.add_header("If-None-Match", etag)
+        request.add_header(
+            "If-Modified-Since",
+            email.utils.formatdate(cache_path.stat().st_mtime, usegmt=True),
+        )
+
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            body = response.read()
+            etag = response.headers.get("ETag", "")
+            last_modified = response.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if not cache_path.exists():
+            raise
+        if e.code >= 500:
+            return cache_path, "offline"
+        if e.code != 304:
+            raise
+        source = "not modified"
+    except urllib.error.URLError:
+        if not cache_path.exists():
+            raise
+        return cache_path, "offline"
+    else:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{filename}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(body)
+        if last_modified and (
+            parsed := email.utils.parsedate_to_datetime(last_modified)
+        ):
+            # Keep the server's timestamp so If-Modified-Since stays meaningful
+            mtime = parsed.timestamp()
+            os.utime(tmp_path, (mtime, mtime))
+        tmp_path.replace(cache_path)
+        etag_path.write_text(etag)
+        source = "fetched"
+
+    checked_path.write_text(str(int(time.time())))
+    return cache_path, source
 
-    if script_name not in AVAILABLE_SCRIPTS:
+
+def _file_sha256(path: Path) -> str | None:
+    """Return the SHA-256 hex digest of a file, or None if it doesn't exist."""
+    if not path.exists():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _build_manifest(directory: Path) -> dict[str, Any]:
+    """Build the manifest for every uv script in a checkout of this repository."""
+    scripts = []
+    for script_path in sorted(directory.glob("*.py")):
+        if "# /// script" not in script_path.read_text(encoding="utf-8"):
+            continue
+        lock_path = script_path.with_name(f"{script_path.name}.lock")
+        scripts.append(
+            {
+                "name": script_path.stem.replace("_", "-"),
+                "filename": script_path.name,
+                "sha256": _file_sha256(script_path),
+                "size": script_path.stat().st_size,
+                "lock_sha256": _file_sha256(lock_path),
+            }
+        )
+    return {"scripts": scripts}
+
+
+@functools.cache
+def _load_manifest() -> dict[str, dict[str, Any]]:
+    """
+    Fetch the script manifest from SCRIPTS_DOMAIN, keyed by script name.
+
+    The manifest is fetched at most once per run and cached like the scripts
+    themselves, so it is still available when offline.
+    """
+    try:
+        manifest_path, _ = _fetch_script(MANIFEST_FILENAME)
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError) as e:
         console.print(
-            f"Error: Unknown script name '{script_name}'. Skipping.", style="red"
+            f"Error: Could not load the script manifest from {SCRIPTS_DOMAIN}: {e}",
+            style="red",
         )
-        console.print("Available scripts:", AVAILABLE_SCRIPTS)
-        return False
+        raise typer.Exit(1) from e
+    return {entry["name"]: entry for entry in manifest["scripts"]}
+
+
+def _load_state() -> dict[str, dict[str, Any]]:
+    """Load the record of installed scripts, keyed by script name."""
+    # Fall back to where earlier versions kept the record, in the cache
+    for state_path in (STATE_PATH, CACHE_DIR / STATE_PATH.name):
+        try:
+            return json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+    return {}
+
+
+def _save_state(state: dict[str, dict[str, Any]]) -> None:
+    """Persist the record of installed scripts."""
+    STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = STATE_PATH.with_name(f"{STATE_PATH.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n")
+    tmp_path.replace(STATE_PATH)
+
+
+def _validate_script(script_path: Path) -> None:
+    """Raise if a fetched script is not a runnable uv script."""
+    source = script_path.read_text(encoding="utf-8")
+    if "# /// script" not in source:
+        raise ValueError(f"'{script_path.name}' has no inline script metadata")
+    compile(source, str(script_path), "exec")
+
+
+def _fetch_verified(filename: str, expected_sha256: str) -> str:
+    """
+    Bring a cached file in line with its manifest hash and return its source.
+
+    Files whose cached copy already matches the manifest are not fetched at
+    all. Raises ValueError if the fetched file doesn't match the manifest.
+    """
+    if _file_sha256(CACHE_DIR / filename) == expected_sha256:
+        return "cached"
+    cache_path, source = _fetch_script(filename)
+    if _file_sha256(cache_path) != expected_sha256:
+        raise ValueError(f"'{filename}' does not match the hash in the manifest")
+    return source
+
+
+def _run_tool(command: list[str]) -> None:
+    """Run an external tool quietly, raising RuntimeError with its output on failure."""
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"'{' '.join(command[:2])}' failed: {result.stderr.strip()}")
+
+
+def _environment_key(entry: dict[str, Any], frozen: bool) -> str:
+    """
+    Return the key identifying the environment a script needs.
+
+    This is the lockfile hash, or the script hash for scripts without a
+    lockfile, prefixed for frozen environments so switching modes rebuilds.
+    """
+    if frozen:
+        return f"frozen:{entry['lock_sha256']}"
+    return entry["lock_sha256"] or entry["sha256"]
+
+
+def _frozen_environment_dir(entry: dict[str, Any]) -> Path:
+    """Return the directory of the frozen environment for a script's lockfile."""
+    return ENVIRONMENTS_DIR / f"{entry['name']}-{entry['lock_sha256'][:16]}"
+
+
+def _build_frozen_environment(entry: dict[str, Any]) -> Path:
+    """Build a dedicated environment for a script from its cached lockfile."""
+    script_path = CACHE_DIR / entry["filename"]
+    lock_path = CACHE_DIR / f"{entry['filename']}.lock"
+    environment_dir = _frozen_environment_dir(entry)
+    requirements_path = environment_dir / "requirements.txt"
+
+    lock = tomllib.loads(lock_path.read_text(encoding="utf-8"))
+    python_request = (
+        ["--python", lock["requires-python"]] if "requires-python" in lock else []
+    )
+
+    # Start over if an earlier build was interrupted. Environments built from
+    # other lockfiles stay, the wrapper may still point at one of them
+    shutil.rmtree(environment_dir, ignore_errors=True)
+    _run_tool(["uv", "venv", "--quiet", *python_request, str(environment_dir)])
+    _run_tool(
+        [
+            "uv",
+            "export",
+            "--quiet",
+            "--script",
+            str(script_path),
+            "--frozen",
+            "--no-header",
+            "--output-file",
+            str(requirements_path),
+        ]
+    )
+    _run_tool(
+        [
+            "uv",
+            "pip",
+            "install",
+            "--quiet",
+            "--python",
+            str(environment_dir / "bin" / "python"),
+            "--no-deps",
+            "--require-hashes",
+            "--compile-bytecode",
+            "--requirement",
+            str(requirements_path),
+        ]
+    )
+    (environment_dir / ".complete").touch()
+    return environment_dir
 
-    filename = script_name.replace("-", "_") + ".py"
-    script_url = f"https://{SCRIPTS_DOMAIN}/{filename}"
+
+def _remove_old_environments(script_name: str, keep: Path | None = None) -> None:
+    """
+    Remove the frozen environments of a script, other than `keep`.
+
+    Only call this once the script's wrapper points at `keep`, or runs the
+    script with uv when `keep` is None, so the command is never left pointing
+    at an environment that no longer exists.
+    """
+    if not ENVIRONMENTS_DIR.exists():
+        return
+    for environment_dir in ENVIRONMENTS_DIR.iterdir():
+        if (
+            environment_dir != keep
+            and environment_dir.name.rsplit("-", 1)[0] == script_name
+        ):
+            shutil.rmtree(environment_dir, ignore_errors=True)
+
+
+def _freeze_script(entry: dict[str, Any], environment_dir: Path) -> None:
+    """Store a byte-compiled copy of a cached script in its frozen environment."""
+    frozen_path = environment_dir / entry["filename"]
+    # Python recognises bytecode by its magic number, so naming the compiled
+    # file after the command keeps the command name in usage messages
+    compiled_path = environment_dir / entry["name"]
+    if _file_sha256(frozen_path) == entry["sha256"] and compiled_path.exists():
+        return
+    shutil.copy2(CACHE_DIR / entry["filename"], frozen_path)
+    _run_tool(
+        [
+            str(environment_dir / "bin" / "python"),
+            "-c",
+            "import py_compile, sys; py_compile.compile(sys.argv[1], sys.argv[2], doraise=True)",
+            str(frozen_path),
+            str(compiled_path),
+        ]
+    )
+
+
+def _prepare_script(
+    entry: dict[str, Any], environment: str | None, frozen: bool
+) -> PreparedScript:
+    """Fetch, validate and pre-build the environment for a script, raising on failure."""
+    start = time.perf_counter()
+    filename = entry["filename"]
+    lock_filename = f"{filename}.lock"
+
+    source = _fetch_verified(filename, entry["sha256"])
+    script_path = CACHE_DIR / filename
+    _validate_script(script_path)
+
+    if entry["lock_sha256"]:
+        _fetch_verified(lock_filename, entry["lock_sha256"])
+    else:
+        # Don't let a stale lockfile pin an environment the server dropped
+        (CACHE_DIR / lock_filename).unlink(missing_ok=True)
+
+    environment_key = _environment_key(entry, frozen)
+    environment_dir = None
+    if frozen:
+        # A dedicated environment per lockfile hash, with a byte-compiled copy
+        # of the script in it, so the wrapper can skip uv entirely
+        if not entry["lock_sha256"]:
+            raise ValueError(
+                f"'{filename}' has no lockfile to build a frozen environment from"
+            )
+        frozen_dir = _frozen_environment_dir(entry)
+        if (frozen_dir / ".complete").exists():
+            status = "unchanged"
+        else:
+            _build_frozen_environment(entry)
+            status = "frozen"
+        _freeze_script(entry, frozen_dir)
+        environment_dir = frozen_dir
+    elif environment_key == environment:
+        status = "unchanged"
+    else:
+        # With the lockfile cached next to the script, uv builds the locked
+        # versions and the wrapper's first `uv run` finds them ready
+        _run_tool(["uv", "sync", "--quiet", "--script", str(script_path)])
+        status = "locked" if entry["lock_sha256"] else "resolved"
+
+    return PreparedScript(
+        source=source,
+        environment=status,
+        environment_key=environment_key,
+        environment_dir=environment_dir,
+        elapsed=time.perf_counter() - start,
+    )
+
+
+def _prepare_scripts(
+    script_names: list[str],
+    state: dict[str, dict[str, Any]],
+    rebuild: bool,
+    frozen_scripts: list[str],
+) -> dict[str, PreparedScript]:
+    """Prepare scripts in parallel, returning those that succeeded by name."""
+    manifest = _load_manifest()
+    with (
+        console.status("Fetching scripts and building environments..."),
+        ThreadPoolExecutor(max_workers=max(len(script_names), 1)) as executor,
+    ):
+        futures = {
+            name: executor.submit(
+                _prepare_script,
+                manifest[name],
+                # Without a recorded environment, uv environments are rebuilt
+                None if rebuild else state.get(name, {}).get("environment"),
+                name in frozen_scripts,
+            )
+            for name in script_names
+        }
+
+    prepared = {}
+    prep_table = Table("Script", "Source", "Environment", "Prep time")
+    for name, future in futures.items():
+        try:
+            prep = future.result()
+        except Exception as e:
+            console.print(f"Error: Could not prepare '{name}': {e}", style="red")
+            prep_table.add_row(name, "-", "[red]failed[/]", "-")
+            continue
+
+        prepared[name] = prep
+        prep_table.add_row(name, prep.source, prep.environment, f"{prep.elapsed:.2f}s")
+
+    if futures:
+        console.print()
+        console.print(prep_table)
+    return prepared
+
+
+def _record_installed(
+    state: dict[str, dict[str, Any]],
+    script_name: str,
+    environment_key: str,
+    frozen: bool,
+) -> None:
+    """Record the manifest hashes a script was installed or upgraded to."""
+    entry = _load_manifest()[script_name]
+    state[script_name] = {
+        "sha256": entry["sha256"],
+        "lock_sha256": entry["lock_sha256"],
+        "environment": environment_key,
+        "frozen": frozen,
+    }
+
+
+def _install_single_script(
+    script_name: str, cache_ttl: int, environment_dir: Path | None = None
+) -> bool:
+    """
+    Installs a single script and returns True on success, False on failure.
+
+    If `environment_dir` is given the wrapper runs the byte-compiled copy of
+    the script stored in that frozen environment instead of using uv.
+    """
+    console.print(f"\nAttempting to install '{script_name}'...", style="yellow")
+
+    filename = _load_manifest()[script_name]["filename"]
+    script_url = f"{SCRIPTS_URL}/{filename}"
     target_path = BIN_DIR / script_name
 
     console.print(f"  Target installation path: {target_path}", style="blue")
@@ -48,12 +457,68 @@ def _install_single_script(script_name: str) -> bool:
 
     BIN_DIR.mkdir(parents=True, exist_ok=True)
 
-    wrapper_content = f"""#!/bin/sh
+    if environment_dir is not None:
+        compiled_path = environment_dir / script_name
+        wrapper_content = f"""#!/bin/sh
+# Generated wrapper for {script_name} by manage_scripts.py
+# Executes a byte-compiled copy of the script with the interpreter of an
+# environment built from its lockfile, without going through uv
+
+exec "{environment_dir}/bin/python" "{compiled_path}" "$@"
+"""
+    else:
+        wrapper_content = f"""#!/bin/sh
 # Generated wrapper for {script_name} by manage_scripts.py
-# Executes the remote script using uv run
+# Executes a locally cached copy of the script using uv run, revalidating the
+# cache in the background once it is older than the TTL
+
+script_url="${{SCRIPTS_BASE_URL:-{SCRIPTS_URL}}}/{filename}"
+cache_dir="${{SCRIPTS_CACHE_DIR:-{CACHE_DIR}}}"
+cache_file="$cache_dir/{filename}"
+ttl="${{SCRIPTS_CACHE_TTL:-{cache_ttl}}}"
+
+if [ ! -f "$cache_file" ] && command -v curl >/dev/null 2>&1; then
+    # Nothing cached, for example after the cache was cleared, so fetch it again
+    mkdir -p "$cache_dir"
+    tmp="$cache_file.$$"
+    if curl --silent --fail --location --remote-time --max-time 30 \\
+        --dump-header "$tmp.headers" --output "$tmp" "$script_url" &&
+        [ -s "$tmp" ]; then
+        sed -n 's/^[Ee][Tt][Aa][Gg]: *//p' "$tmp.headers" | tr -d '\\r' |
+            tail -n 1 >"$cache_file.etag"
+        mv -f "$tmp" "$cache_file"
+        date +%s >"$cache_file.checked"
+    fi
+    rm -f "$tmp" "$tmp.headers"
+fi
+
+if [ ! -f "$cache_file" ]; then
+    # The script couldn't be cached, run the remote script directly
+    exec uv run --quiet "$script_url" "$@"
+fi
+
+now=$(date +%s)
+checked=$(cat "$cache_file.checked" 2>/dev/null || echo 0)
+if [ $((now - ${{checked:-0}})) -ge "$ttl" ] && command -v curl >/dev/null 2>&1; then
+    echo "$now" >"$cache_file.checked"
+    (
+        tmp="$cache_file.$$"
+        etag=$(cat "$cache_file.etag" 2>/dev/null)
+        status=$(curl --silent --location --remote-time --max-time 30 \\
+            --time-cond "$cache_file" ${{etag:+--header "If-None-Match: $etag"}} \\
+            --dump-header "$tmp.headers" --output "$tmp" \\
+            --write-out '%{{http_code}}' "$script_url")
+        if [ "$status" = 200 ] && [ -s "$tmp" ]; then
+            sed -n 's/^[Ee][Tt][Aa][Gg]: *//p' "$tmp.headers" | tr -d '\\r' |
+                tail -n 1 >"$cache_file.etag"
+            mv -f "$tmp" "$cache_file"
+        fi
+        rm -f "$tmp" "$tmp.headers"
+    ) >/dev/null 2>&1 &
+fi
 
 # Use --quiet to suppress uv's own output unless there's an error
-exec uv run --quiet {script_url} "$@"
+exec uv run --quiet --script "$cache_file" "$@"
 """
 
     try:
@@ -88,6 +553,114 @@ exec uv run --quiet {script_url} "$@"
         return False
 
 
+def _run_timed(command: list[str], env: dict[str, str]) -> tuple[float, str]:
+    """Run a command to completion and return its wall time and stderr."""
+    start = time.perf_counter()
+    result = subprocess.run(command, env=env, capture_output=True, text=True)
+    elapsed = time.perf_counter() - start
+    if result.returncode != 0:
+        errors = [
+            line
+            for line in result.stderr.splitlines()
+            if not line.startswith("import time:")
+        ]
+        raise RuntimeError(
+            f"'{' '.join(command)}' exited with {result.returncode}: "
+            + "\n".join(errors[-10:])
+        )
+    return elapsed, result.stderr
+
+
+def _import_seconds(stderr: str) -> float:
+    """Sum the top-level module import times from `-X importtime` output."""
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|", 2)
+        # Nested imports are indented below the module that imported them
+        if name.startswith("  ") or not cumulative.strip().isdigit():
+            continue
+        total_us += int(cumulative)
+    return total_us / 1_000_000
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    """Return the p50/p90/p99 of a list of timings, in milliseconds."""
+    if len(samples) == 1:
+        return {
+            "p50": samples[0] * 1000,
+            "p90": samples[0] * 1000,
+            "p99": samples[0] * 1000,
+        }
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": cuts[49] * 1000, "p90": cuts[89] * 1000, "p99": cuts[98] * 1000}
+
+
+def _bench_script(
+    script_name: str, args: list[str], mode: str, runs: int, base_url: str
+) -> dict[str, list[float]]:
+    """Time repeated cold or warm runs of an installed command, split into stages."""
+    import urllib.request
+
+    filename = _load_manifest()[script_name]["filename"]
+    command = [str(BIN_DIR / script_name), *args]
+    env = os.environ | {
+        "PYTHONPROFILEIMPORTTIME": "1",
+        # Keep background revalidation from competing with the timed runs
+        "SCRIPTS_CACHE_TTL": str(2**31),
+    }
+    stages: dict[str, list[float]] = {
+        SHELL_ESTIMATE_STAGE: [],
+        FETCH_ESTIMATE_STAGE: [],
+        "wrapper + uv + interpreter": [],
+        "imports": [],
+        "total": [],
+    }
+
+    if mode == "warm":
+        # Populate the real caches before timing anything
+        _run_timed(command, env)
+
+    for _ in range(runs):
+        # Starting a bare shell is a baseline for the wrapper's shell, but not
+        # the wrapper's own work, which is counted with uv and the interpreter
+        shell, _ = _run_timed(["sh", "-c", ":"], env)
+        fetch = 0.0
+        if mode == "cold":
+            # The wrapper fetches the script itself, which can't be timed on
+            # its own, so time a separate GET as an estimate of it
+            start = time.perf_counter()
+            with urllib.request.urlopen(f"{base_url}/{filename}") as response:
+                response.read()
+            fetch = time.perf_counter() - start
+
+            # Empty caches, so the script is fetched from `base_url` and its
+            # dependencies resolved and installed from scratch
+            with tempfile.TemporaryDirectory() as temp_dir:
+                cold_env = env | {
+                    "SCRIPTS_BASE_URL": base_url,
+                    "SCRIPTS_CACHE_DIR": str(Path(temp_dir) / "scripts"),
+                    "UV_CACHE_DIR": str(Path(temp_dir) / "uv"),
+                }
+                total, stderr = _run_timed(command, cold_env)
+        else:
+            total, stderr = _run_timed(command, env)
+
+        imports = _import_seconds(stderr)
+        stages[SHELL_ESTIMATE_STAGE].append(shell)
+        stages[FETCH_ESTIMATE_STAGE].append(fetch)
+        stages["imports"].append(imports)
+        stages["wrapper + uv + interpreter"].append(
+            max(total - shell - fetch - imports, 0.0)
+        )
+        stages["total"].append(total)
+
+    if mode == "warm":
+        del stages[FETCH_ESTIMATE_STAGE]
+    return stages
+
+
 @app.command()
 def install(
     script_names: Annotated[
@@ -99,13 +672,39 @@ def install(
             metavar="SCRIPT_NAME",
         ),
     ] = None,  # Default to None to detect if arguments were passed
+    cache_ttl: Annotated[
+        int,
+        typer.Option(
+            "--cache-ttl",
+            help=(
+                "Seconds before a wrapper revalidates its cached script in the background. Can be overridden at runtime with SCRIPTS_CACHE_TTL."
+            ),
+            min=0,
+        ),
+    ] = DEFAULT_CACHE_TTL,
+    frozen: Annotated[
+        bool,
+        typer.Option(
+            "--frozen",
+            help=(
+                "Build a dedicated environment for each script from its lockfile and run a byte-compiled copy of the script with it directly, bypassing uv. Frozen scripts only change when upgraded."
+            ),
+        ),
+    ] = False,
 ):
     """
     Install one or more scripts as executable commands in ~/.local/bin.
 
-    Creates small wrapper scripts that use 'uv run' to execute the
-    latest version of the script directly from the web.
+    Creates small wrapper scripts that use 'uv run' to execute a locally
+    cached copy of the script, which is kept up to date from the web in the
+    background and used as-is when offline. The selected scripts are fetched
+    and their uv environments built in parallel, so the first run of an
+    installed command is as fast as any later one.
+
+    With --frozen the wrappers skip uv entirely and start as fast as plain
+    Python, at the cost of only picking up new versions through 'upgrade'.
     """
+    available_scripts = list(_load_manifest())
     selected_scripts: list[str] = []
 
     if not script_names:
@@ -114,7 +713,7 @@ def install(
             "\nAvailable scripts for installation:",
             style="yellow",
         )
-        for i, script in enumerate(AVAILABLE_SCRIPTS, 1):
+        for i, script in enumerate(available_scripts, 1):
             console.print(f"  [bold cyan]{i}[/]: {script}")
 
         while not selected_scripts:
@@ -126,7 +725,7 @@ def install(
                     int(n.strip()) - 1 for n in raw_selection.split(",") if n.strip()
                 ]
                 valid_indices = [
-                    idx for idx in indices if 0 <= idx < len(AVAILABLE_SCRIPTS)
+                    idx for idx in indices if 0 <= idx < len(available_scripts)
                 ]
                 invalid_indices = [
                     idx + 1 for idx in indices if idx not in valid_indices
@@ -146,7 +745,7 @@ def install(
                     continue  # Ask again
 
                 # Get script names based on valid indices
-                potential_scripts = [AVAILABLE_SCRIPTS[idx] for idx in valid_indices]
+                potential_scripts = [available_scripts[idx] for idx in valid_indices]
                 # Remove duplicates while preserving order
                 selected_scripts = list(dict.fromkeys(potential_scripts))
 
@@ -174,11 +773,35 @@ def install(
     success_count = 0
     fail_count = 0
 
-    for name in selected_scripts:
-        if _install_single_script(name):
+    unknown_scripts = [
+        name for name in selected_scripts if name not in available_scripts
+    ]
+    for name in unknown_scripts:
+        console.print(f"Error: Unknown script name '{name}'. Skipping.", style="red")
+        fail_count += 1
+    if unknown_scripts:
+        console.print("Available scripts:", available_scripts)
+
+    known_scripts = [name for name in selected_scripts if name in available_scripts]
+    state = _load_state()
+    prepared = _prepare_scripts(
+        known_scripts,
+        state,
+        rebuild=True,
+        frozen_scripts=known_scripts if frozen else [],
+    )
+    fail_count += len(known_scripts) - len(prepared)
+
+    for name, prep in prepared.items():
+        if _install_single_script(name, cache_ttl, prep.environment_dir):
+            _record_installed(state, name, prep.environment_key, frozen)
+            # The wrapper no longer uses any other environment, including one
+            # left over from installing the script with --frozen before
+            _remove_old_environments(name, prep.environment_dir)
             success_count += 1
         else:
             fail_count += 1
+    _save_state(state)
 
     console.print("\n--- Installation Summary ---", style="bold")
     console.print(f"Successfully installed: {success_count}", style="green")
@@ -195,5 +818,333 @@ def install(
         sys.exit(1)  # Exit with error code if any installation failed
 
 
+@app.command()
+def status():
+    """
+    Compare the installed scripts with the manifest published on the web.
+    """
+    manifest = _load_manifest()
+    state = _load_state()
+
+    table = Table(
+        "Script", "Mode", "Installed", "Available", "Script status", "Environment"
+    )
+    for name, entry in manifest.items():
+        installed = state.get(name)
+        if installed is None:
+            table.add_row(name, "-", "-", entry["sha256"][:12], "not installed", "-")
+            continue
+
+        frozen = installed.get("frozen", False)
+        if frozen:
+            # Frozen wrappers run the copy stored in their environment
+            environment_dir = _frozen_environment_dir(
+                {"name": name, "lock_sha256": installed["lock_sha256"]}
+            )
+            script_path = environment_dir / entry["filename"]
+        else:
+            # The wrapper refreshes the cached copy itself, so check what's on disk
+            script_path = CACHE_DIR / entry["filename"]
+        cached_sha256 = _file_sha256(script_path)
+        script_status = (
+            "[green]up to date[/]"
+            if cached_sha256 == entry["sha256"]
+            else "[yellow]changed[/]"
+        )
+        environment_status = (
+            "[green]up to date[/]"
+            if installed["environment"] == _environment_key(entry, frozen)
+            else "[yellow]changed[/]"
+        )
+        table.add_row(
+            name,
+            "frozen" if frozen else "uv",
+            (cached_sha256 or "missing")[:12],
+            entry["sha256"][:12],
+            script_status,
+            environment_status,
+        )
+
+    for name in state.keys() - manifest.keys():
+        table.add_row(
+            name, "-", state[name]["sha256"][:12], "-", "[red]removed[/]", "-"
+        )
+
+    console.print(table)
+
+
+@app.command()
+def upgrade(
+    script_names: Annotated[
+        list[str] | None,
+        typer.Argument(
+            help="Installed scripts to upgrade. Defaults to all installed scripts.",
+            metavar="SCRIPT_NAME",
+        ),
+    ] = None,
+):
+    """
+    Upgrade installed scripts to the versions listed in the manifest.
+
+    Only scripts whose hashes differ from the manifest are fetched again, and
+    only environments whose lockfile changed are rebuilt.
+    """
+    manifest = _load_manifest()
+    state = _load_state()
+
+    selected_scripts = list(dict.fromkeys(script_names or state))
+    not_installed = [name for name in selected_scripts if name not in state]
+    for name in not_installed:
+        console.print(f"Error: '{name}' is not installed. Skipping.", style="red")
+    removed = [name for name in selected_scripts if name not in manifest]
+    for name in removed:
+        console.print(
+            f"Warning: '{name}' is no longer published. Skipping.", style="yellow"
+        )
+
+    upgradable = [
+        name for name in selected_scripts if name in state and name in manifest
+    ]
+    if not upgradable:
+        console.print("No installed scripts to upgrade.", style="yellow")
+        raise typer.Exit(1 if not_installed else 0)
+
+    frozen_scripts = [name for name in upgradable if state[name].get("frozen")]
+    prepared = _prepare_scripts(
+        upgradable, state, rebuild=False, frozen_scripts=frozen_scripts
+    )
+    wrapper_fail_count = 0
+    for name, prep in prepared.items():
+        frozen = name in frozen_scripts
+        # The wrapper points into the environment, which moved with the lockfile,
+        # or may not have been rewritten yet if that failed in an earlier run
+        if frozen and (
+            prep.environment != "unchanged"
+            or state[name].get("environment") != prep.environment_key
+        ):
+            if not _install_single_script(
+                name, DEFAULT_CACHE_TTL, prep.environment_dir
+            ):
+                wrapper_fail_count += 1
+                continue
+            _remove_old_environments(name, prep.environment_dir)
+        _record_installed(state, name, prep.environment_key, frozen)
+    _save_state(state)
+
+    upgraded_count = sum(
+        1
+        for prep in prepared.values()
+        if prep.source != "cached" or prep.environment != "unchanged"
+    )
+    fail_count = (
+        len(not_installed) + len(upgradable) - len(prepared) + wrapper_fail_count
+    )
+    console.print("\n--- Upgrade Summary ---", style="bold")
+    console.print(f"Upgraded: {upgraded_count}", style="green")
+    console.print(
+        f"Already up to date: {len(prepared) - upgraded_count}", style="green"
+    )
+    console.print(f"Failed upgrades: {fail_count}", style="red")
+
+    if fail_count > 0:
+        sys.exit(1)
+
+
+@app.command()
+def bench(
+    script_names: Annotated[
+        list[str] | None,
+        typer.Argument(
+            help="Installed scripts to benchmark. Defaults to all installed scripts, unless --arg is given.",
+            metavar="SCRIPT_NAME",
+        ),
+    ] = None,
+    runs: Annotated[
+        int, typer.Option("--runs", help="Timed runs per script and mode.", min=1)
+    ] = 5,
+    modes: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--mode",
+            help="Benchmark mode to run, 'cold' or 'warm'. Can be given twice. Defaults to both.",
+        ),
+    ] = None,
+    source: Annotated[
+        Path | None,
+        typer.Option(
+            "--source",
+            help="Checkout of the scripts repository to serve in place of SCRIPTS_DOMAIN for cold runs. Defaults to the directory of this script.",
+            file_okay=False,
+        ),
+    ] = None,
+    json_path: Annotated[
+        Path | None,
+        typer.Option("--json", help="Also write the results as JSON to this file."),
+    ] = None,
+    args: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--arg",
+            help="Argument to run each command with. Can be given multiple times. Defaults to --help. Requires naming the scripts to benchmark.",
+        ),
+    ] = None,
+    max_import_ms: Annotated[
+        float | None,
+        typer.Option(
+            "--max-import-ms",
+            help="Fail if the median time any command spends importing modules exceeds this many milliseconds.",
+        ),
+    ] = None,
+):
+    """
+    Benchmark the startup latency of installed commands.
+
+    Each command is run with --help, cold (empty uv and script caches, with
+    the scripts served from a local HTTP server) and warm. The time spent is
+    split into shell startup (estimated from a bare shell), fetching the
+    script (estimated from a separate request), the wrapper, uv resolution
+    and interpreter startup, and module imports, and reported as percentiles.
+    Frozen commands don't use the caches, so they are only run warm.
+    With --max-import-ms the import time is also checked against a budget, so
+    startup regressions fail loudly.
+    """
+    # Only needed to serve the scripts, and slow to import
+    import http.server
+
+    if args and not script_names:
+        # Arguments only make sense for particular commands, and running every
+        # installed command with them could do real work, e.g. clone a repo
+        console.print(
+            "Error: Name the scripts to benchmark when passing --arg.", style="red"
+        )
+        raise typer.Exit(1)
+
+    modes = modes or ["cold", "warm"]
+    source = source or Path(__file__).resolve().parent
+    manifest = _load_manifest()
+    state = _load_state()
+
+    selected_scripts = list(dict.fromkeys(script_names or state))
+    for name in selected_scripts:
+        if name not in state or name not in manifest or not (BIN_DIR / name).exists():
+            console.print(f"Error: '{name}' is not installed.", style="red")
+            raise typer.Exit(1)
+    for mode in modes:
+        if mode not in ("cold", "warm"):
+            console.print(f"Error: Unknown mode '{mode}'.", style="red")
+            raise typer.Exit(1)
+    if "cold" in modes:
+        missing = [
+            manifest[name]["filename"]
+            for name in selected_scripts
+            if not state[name].get("frozen")
+            and not (source / manifest[name]["filename"]).exists()
+        ]
+        if missing:
+            console.print(
+                f"Error: {', '.join(missing)} not found in {source}. Use --source to point at a checkout of the scripts repository.",
+                style="red",
+            )
+            raise typer.Exit(1)
+
+    class QuietHandler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = http.server.ThreadingHTTPServer(
+        ("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(source))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+
+    results: dict[str, dict[str, dict[str, dict[str, Any]]]] = {}
+    try:
+        for name in selected_scripts:
+            for mode in dict.fromkeys(modes):
+                if mode == "cold" and state[name].get("frozen"):
+                    # Frozen wrappers don't use the uv or script caches, so a
+                    # cold run would time exactly the same thing as a warm one
+                    console.print(
+                        f"Skipping cold runs of '{name}', which is installed frozen.",
+                        style="yellow",
+                    )
+                    continue
+                with console.status(f"Benchmarking '{name}' ({mode})..."):
+                    stages = _bench_script(
+                        name, args or ["--help"], mode, runs, base_url
+                    )
+                results.setdefault(name, {})[mode] = {
+                    stage: {
+                        **_percentiles(samples),
+                        "samples": [sample * 1000 for sample in samples],
+                    }
+                    for stage, samples in stages.items()
+                }
+    except (OSError, RuntimeError) as e:
+        console.print(f"Error: {e}", style="red")
+        raise typer.Exit(1) from e
+    finally:
+        server.shutdown()
+
+    table = Table("Script", "Mode", "Stage", "p50 (ms)", "p90 (ms)", "p99 (ms)")
+    for name, mode_results in results.items():
+        for mode, stage_results in mode_results.items():
+            for stage, timings in stage_results.items():
+                table.add_row(
+                    name,
+                    mode,
+                    stage,
+                    f"{timings['p50']:.1f}",
+                    f"{timings['p90']:.1f}",
+                    f"{timings['p99']:.1f}",
+                )
+    console.print(table)
+
+    if json_path is not None:
+        json_path.write_text(
+            json.dumps({"unit": "ms", "runs": runs, "results": results}, indent=2)
+            + "\n"
+        )
+        console.print(f"Wrote results to {json_path}", style="green")
+
+    if max_import_ms is not None:
+        over_budget = [
+            (name, mode, stage_results["imports"]["p50"])
+            for name, mode_results in results.items()
+            for mode, stage_results in mode_results.items()
+            if stage_results["imports"]["p50"] > max_import_ms
+        ]
+        for name, mode, import_ms in over_budget:
+            console.print(
+                f"Error: '{name}' spends {import_ms:.1f}ms importing modules ({mode}), over the {max_import_ms:g}ms budget.",
+                style="red",
+            )
+        if over_budget:
+            raise typer.Exit(1)
+
+
+@app.command("manifest")
+def write_manifest(
+    directory: Annotated[
+        Path,
+        typer.Argument(
+            help="Checkout of the scripts repository to build the manifest for.",
+            exists=True,
+            file_okay=False,
+        ),
+    ] = Path("."),
+):
+    """
+    Write the manifest.json that is published alongside the scripts.
+    """
+    manifest_path = directory / MANIFEST_FILENAME
+    manifest_data = _build_manifest(directory)
+    manifest_path.write_text(json.dumps(manifest_data, indent=2) + "\n")
+    console.print(
+        f"Wrote {len(manifest_data['scripts'])} scripts to {manifest_path}",
+        style="green",
+    )
+
+
 if __name__ == "__main__":
     app()
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+# Milliseconds `install_windsurf.py version` may spend importing modules other
+# than typer, which every script needs and which alone takes ~300ms. This is
+# ~30ms on a slow single-core machine, and importing httpx up front adds ~130ms.
+VERSION_IMPORT_BUDGET_MS = 75
+
+
+def _parse_import_times(stderr: str) -> tuple[set[str], dict[str, int]]:
+    """
+    Parse `-X importtime` output into every module imported and the cumulative
+    import time, in microseconds, of each top-level import.
+    """
+    modules = set()
+    top_level = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|", 2)
+        if not cumulative.strip().isdigit():
+            continue
+        modules.add(name.strip())
+        # Nested imports are indented below the module that imported them
+        if not name.startswith("  "):
+            top_level[name.strip()] = int(cumulative)
+    return modules, top_level
+
+
+@pytest.mark.skipif(shutil.which("uv") is None, reason="uv is not installed")
+def test_install_windsurf_version_import_budget() -> None:
+    """The version command doesn't import httpx and stays within its budget."""
+    import_ms = []
+    for _ in range(3):
+        result = subprocess.run(
+            [
+                "uv",
+                "run",
+                "--quiet",
+                "--script",
+                str(REPO_DIR / "install_windsurf.py"),
+                "version",
+            ],
+            env=os.environ | {"PYTHONPROFILEIMPORTTIME": "1"},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        modules, top_level = _parse_import_times(result.stderr)
+        assert "httpx" not in modules
+        top_level.pop("typer", None)
+        import_ms.append(sum(top_level.values()) / 1000)
+
+    # Take the fastest run, the one least disturbed by the rest of the machine
+    assert min(import_ms) <= VERSION_IMPORT_BUDGET_MS, (
+        f"install_windsurf.py version spends {min(import_ms):.1f}ms importing "
+        f"modules besides typer, over the {VERSION_IMPORT_BUDGET_MS}ms budget"
+    )